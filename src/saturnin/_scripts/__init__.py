@@ -1,3 +1,15 @@
 # SPDX-FileCopyrightText: 2019-present The Firebird Projects <www.firebirdsql.org>
 #
 # SPDX-License-Identifier: MIT
+
+"""Saturnin console scripts.
+"""
+
+from __future__ import annotations
+import logging
+
+#: Logging level names accepted by `--log-level` option of Saturnin scripts
+#: (`logging.getLevelNamesMapping` is available since Python 3.11)
+LOG_LEVELS = tuple(name.upper() for name in
+                   getattr(logging, 'getLevelNamesMapping',
+                           lambda: logging._nameToLevel)()) # pylint: disable=W0212
@@ -39,24 +39,19 @@
 """
 
 from __future__ import annotations
-from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter, Action
+from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
 from configparser import ConfigParser, ExtendedInterpolation
 import logging
 from logging.config import fileConfig
 from firebird.base.logging import get_logger, Logger, ANY, bind_logger
 from firebird.base.trace import trace_manager
+from saturnin._scripts import LOG_LEVELS
 from saturnin.base import directory_scheme, SECTION_BUNDLE
 from saturnin.component.controller import Outcome
 from saturnin.component.bundle import BundleExecutor
 
 LOG_FORMAT = '%(levelname)s [%(processName)s/%(threadName)s] %(message)s'
 
-class UpperAction(Action):
-    """Converts argument to uppercase.
-    """
-    def __call__(self, parser, namespace, values, option_string=None):
-        setattr(namespace, self.dest, values.upper())
-
 def main(description: str=None, bundle_config: str=None):
     """Saturnin script to run bundle of services.
 
@@ -67,7 +62,7 @@ def main(description: str=None, bundle_config: str=None):
     usage::
 
       saturnin-bundle [-h] [-c CONFIG] [-s SECTION] [-q] [-o]
-                      [-l {critical,fatal,error,warn,warning,info,debug,notset}]
+                      [-l {CRITICAL,FATAL,ERROR,WARN,WARNING,INFO,DEBUG,NOTSET}]
                       BUNDLE-CONFIG
 
     positional arguments:
@@ -81,8 +76,8 @@ def main(description: str=None, bundle_config: str=None):
                             Configuration section name (default: bundle)
       -q, --quiet           Suppress console output. (default: False)
       -o, --outcome         Always print service execution outcome (default: False)
-      -l {critical,fatal,error,warn,warning,info,debug,notset}, --log-level {critical,fatal,error,warn,warning,info,debug,notset}
-                            Logging level (default: None)
+      -l {CRITICAL,FATAL,ERROR,WARN,WARNING,INFO,DEBUG,NOTSET}, --log-level {CRITICAL,FATAL,ERROR,WARN,WARNING,INFO,DEBUG,NOTSET}
+                            Logging level, case insensitive (default: None)
     """
     if description is None:
         description = "Saturnin script to run bundle of services."
@@ -101,10 +96,9 @@ def main(description: str=None, bundle_config: str=None):
                         default=False)
     parser.add_argument('-o','--outcome', action='store_true',
                         help="Always print service execution outcome", default=False)
-    parser.add_argument('-l', '--log-level', action=UpperAction,
-                        choices=[x.lower() for x in logging._nameToLevel
-                                 if isinstance(x, str)],
-                        help="Logging level")
+    parser.add_argument('-l', '--log-level', type=str.upper,
+                        choices=LOG_LEVELS,
+                        help="Logging level, case insensitive")
 
     args = parser.parse_args()
 
@@ -32,7 +32,7 @@
 #
 # Contributor(s): Pavel Císař (original code)
 #                 ______________________________________
- # pylint: disable=W1510
+ # pylint: disable=W1510, C0415
 
 """Saturnin package manager commands
 
@@ -41,13 +41,10 @@
 
 from __future__ import annotations
 from typing import List
-import subprocess
 from uuid import UUID
-from re import sub
 from operator import attrgetter
 from rich.table import Table
 from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich import box
 import typer
 from firebird.uuid import oid_registry
@@ -218,6 +215,7 @@ def update_registry():
 def pip(args: List[str]=typer.Argument(None, help="Arguments for pip.")):
     """Runs 'pip' package manager in Saturnin virtual environment.
     """
+    import subprocess
     pip_cmd = directory_scheme.get_pip_cmd()
     pip_cmd.extend(args)
     if '--help' in args:
@@ -237,6 +235,9 @@ def install_package(args: List[str]=typer.Argument(..., help="Arguments for pip
 Note:
    This command is used also to upgrade installed packages using '-U' or '--upgrade' option.
     """
+    import subprocess
+    from re import sub
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     pip_cmd = directory_scheme.get_pip_cmd('install')
     pip_cmd.extend(args)
     if '--help' in args:
@@ -261,6 +262,9 @@ Note:
 def uninstall_package(args: List[str]=typer.Argument(..., help="Arguments for pip uninstall.")):
     """Uninstalls Python package from Saturnin virtual environment via `pip`.
     """
+    import subprocess
+    from re import sub
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     pip_cmd = directory_scheme.get_pip_cmd('uninstall')
     pip_cmd.append('--yes')
     pip_cmd.extend(args)
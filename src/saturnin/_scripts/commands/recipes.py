@@ -43,9 +43,11 @@ from __future__ import annotations
 from typing import List, Tuple
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from shutil import copyfile
 from configparser import ConfigParser, ExtendedInterpolation
 from uuid import UUID
-from datetime import datetime
+from datetime import timedelta
+from time import perf_counter
 import subprocess
 import typer
 from rich.table import Table
@@ -55,8 +57,7 @@ from rich.syntax import Syntax
 from rich import box
 from firebird.uuid import oid_registry, Node
 from firebird.base.config import Config
-from saturnin.base import (saturnin_config, SECTION_BUNDLE, SECTION_SERVICE,
-                           directory_scheme, RESTART)
+from saturnin.base import SECTION_BUNDLE, SECTION_SERVICE, directory_scheme, RESTART
 from saturnin.component.recipe import (recipe_registry, RecipeInfo, SaturninRecipe,
                                        RecipeType, RecipeExecutionMode)
 from saturnin.component.registry import service_registry, ServiceInfo
@@ -114,9 +115,9 @@ def run_recipe(ctx: typer.Context,
             cmd.insert(0, '-p')
             cmd.insert(0, 'start')
             cmd.insert(0, 'saturnin-daemon')
-        start = datetime.now()
+        start = perf_counter()
         result = subprocess.run(cmd) # pylint: disable=W1510
-        console.print(f'Execution time: {datetime.now() - start}')
+        console.print(f'Execution time: {timedelta(seconds=perf_counter() - start)}')
         if pid_file:
             if pid_file.exists():
                 pid = int(pid_file.read_text())
@@ -241,6 +242,7 @@ def edit_recipe(recipe_name: str=typer.Argument(..., help="Recipe name",
     if recipe is None:
         console.print_error(f"Recipe '{recipe_name}' not installed")
         return None
+    from saturnin.base import saturnin_config # pylint: disable=C0415
     edited = typer.edit(recipe.filename.read_text(), saturnin_config.editor.value,
                         extension=recipe.filename.suffix)
     if edited is not None:
@@ -288,9 +290,9 @@ def install_recipe(recipe_name: str= \
     #
     target: Path = directory_scheme.recipes
     config: ConfigParser = ConfigParser(interpolation=ExtendedInterpolation())
+    recipe_content: str = None
     if app is None: # Import recipe
         config.read(recipe_file)
-        recipe_content = recipe_file.read_text()
         target = target / recipe_file.with_stem(recipe_name).name
     else: # Import application
         recipe_content = app.config_obj()
@@ -331,7 +333,10 @@ def install_recipe(recipe_name: str= \
         console.print_error(f"The recipe does not have the required section '{section}'")
         return None
     #
-    target.write_text(recipe_content)
+    if recipe_content is None:
+        copyfile(recipe_file, target)
+    else:
+        target.write_text(recipe_content)
     console.print("Recipe installed.")
     recipe_registry.clear()
     recipe_registry.load_from(directory_scheme.recipes)
@@ -349,7 +354,7 @@ def uninstall_recipe(recipe_name: str=typer.Argument(None, autocompletion=recipe
         console.print_error(f"Recipe '{recipe_name}' not installed")
         return None
     if save_to is not None:
-        save_to.write_text(recipe.filename.read_text())
+        copyfile(recipe.filename, save_to)
     recipe.filename.unlink()
     console.print("Recipe uninstalled.")
     recipe_registry.clear()
@@ -399,6 +404,7 @@ def create_recipe(plain: bool=typer.Option(False, '--plain', help="Create recipe
     recipe_text += bundle_config.get_config(plain=plain) if recipe_type is RecipeType.BUNDLE\
         else component_config.get_config(plain=plain)
     target: Path = directory_scheme.recipes / f'{recipe_name}.cfg'
+    from saturnin.base import saturnin_config # pylint: disable=C0415
     recipe_text = typer.edit(recipe_text, saturnin_config.editor.value,
                              extension='.cfg', require_save=False)
     if recipe_text is not None:
@@ -39,6 +39,8 @@
 """
 
 from __future__ import annotations
+from typing import Tuple
+import os
 from pathlib import Path
 from enum import Enum
 import typer
@@ -47,13 +49,29 @@ from rich.table import Table
 from rich import box
 from rich.prompt import Confirm
 from rich.syntax import Syntax
-from saturnin.base import CONFIG_HDR, directory_scheme, saturnin_config, venv
+from saturnin.base import CONFIG_HDR, directory_scheme, venv
 from saturnin.lib.console import console, DEFAULT_THEME, RICH_YES, RICH_NO, RICH_OK
 from saturnin._scripts.completers import path_completer
 
 #: Typer command group for site management commands
 app = typer.Typer(rich_markup_mode="rich", help="Saturnin site management.")
 
+def _site_dirs() -> Tuple[Tuple[str, Path], ...]:
+    """Returns Saturnin directories as (description, path) pairs, used by `initialize`
+    and `list_directories` commands. Paths are taken from current `.directory_scheme`.
+    """
+    return (('Saturnin configuration', directory_scheme.config),
+            ('Saturnin data', directory_scheme.data),
+            ('Run-time data', directory_scheme.run_data),
+            ('Log files', directory_scheme.logs),
+            ('Temporary files', directory_scheme.tmp),
+            ('Cache', directory_scheme.cache),
+            ('User-specific configuration', directory_scheme.user_config),
+            ('User-specific data', directory_scheme.user_data),
+            ('PID files', directory_scheme.pids),
+            ('Recipes', directory_scheme.recipes),
+            )
+
 def ensure_dir(description: str, path: Path):
     """Create directory (incl. parents) if it does not exists.
 
@@ -62,8 +80,7 @@ def ensure_dir(description: str, path: Path):
       path: Directory path.
     """
     console.print(f"{description}: [path]{path}[/path] ... ", end='')
-    if not path.exists():
-        path.mkdir(parents=True)
+    os.makedirs(path, exist_ok=True)
     console.print(RICH_OK)
 
 def ensure_config(path: Path, content: str, new_config: bool):
@@ -75,13 +92,17 @@ def ensure_config(path: Path, content: str, new_config: bool):
       new_config: When True, the configuration file is written even if it elready exists,
                   but original file is kept as renamed with '.bak' suffix.
     """
-    if path.is_file():
+    try:
+        file = path.open('x')
+    except FileExistsError:
         if not new_config:
             console.print(f"  Info : [path]{path}[/path] already exists.")
             return
         path.replace(path.with_suffix(path.suffix + '.bak'))
+        file = path.open('x')
     console.print(f"  Writing : [path]{path}[/path] ... ", end='')
-    path.write_text(content)
+    with file:
+        file.write(content)
     console.print(RICH_OK)
 
 def add_path(table: Table, description: str, path: Path) -> None:
@@ -135,25 +156,21 @@ def initialize(new_config: bool= \
     if not yes:
         yes = Confirm.ask("Are you sure you want to initialize the Saturnin environment?")
     if yes:
+        from saturnin.base import saturnin_config # pylint: disable=C0415
         saturnin_cfg = CONFIG_HDR + saturnin_config.get_config()
-        steps = [(console.print, ['Ensuring existence of Saturnin directories...']),
-                 (ensure_dir, ["  Saturnin configuration      ", directory_scheme.config]),
-                 (ensure_dir, ["  Saturnin data               ", directory_scheme.data]) ,
-                 (ensure_dir, ["  Run-time data               ", directory_scheme.run_data]) ,
-                 (ensure_dir, ["  Log files                   ", directory_scheme.logs]) ,
-                 (ensure_dir, ["  Temporary files             ", directory_scheme.tmp]) ,
-                 (ensure_dir, ["  Cache                       ", directory_scheme.cache]) ,
-                 (ensure_dir, ["  User-specific configuration ", directory_scheme.user_config]) ,
-                 (ensure_dir, ["  User-specific data          ", directory_scheme.user_data]) ,
-                 (ensure_dir, ["  PID files                   ", directory_scheme.pids]) ,
-                 (ensure_dir, ["  Recipes                     ", directory_scheme.recipes]) ,
-                 (console.print, ['Creating configuration files...']),
-                 (ensure_config, [directory_scheme.site_conf, saturnin_cfg, new_config]) ,
-                 (ensure_config, [directory_scheme.user_conf, saturnin_cfg, new_config]) ,
-                 (ensure_config, [directory_scheme.theme_file, DEFAULT_THEME.config, new_config]) ,
-                 ]
-        for func, params in steps:
-            func(*params)
+        steps = [(console.print, ['Ensuring existence of Saturnin directories...'])]
+        steps.extend((ensure_dir, [f"  {description:<28}", path])
+                     for description, path in _site_dirs())
+        steps.extend([(console.print, ['Creating configuration files...']),
+                      (ensure_config, [directory_scheme.site_conf, saturnin_cfg, new_config]),
+                      (ensure_config, [directory_scheme.user_conf, saturnin_cfg, new_config]),
+                      (ensure_config, [directory_scheme.theme_file, DEFAULT_THEME.config,
+                                       new_config]),
+                      ])
+        # Console output is buffered and written at once when all steps are done
+        with console.std_console:
+            for func, params in steps:
+                func(*params)
 
 @app.command()
 def list_directories() -> None:
@@ -168,16 +185,8 @@ def list_directories() -> None:
         tbl.add_row('[bold]SATURNIN_HOME[/bold] is set to', ':', str(directory_scheme.home))
     else:
         tbl.add_row('[important]SATURNIN_HOME env. variable not defined', '', '')
-    add_path(tbl, 'Saturnin configuration', directory_scheme.config)
-    add_path(tbl, 'Saturnin data', directory_scheme.data)
-    add_path(tbl, 'Run-time data', directory_scheme.run_data)
-    add_path(tbl, 'Log files', directory_scheme.logs)
-    add_path(tbl, 'Temporary files', directory_scheme.tmp)
-    add_path(tbl, 'Cache', directory_scheme.cache)
-    add_path(tbl, 'User-specific configuration', directory_scheme.user_config)
-    add_path(tbl, 'User-specific data', directory_scheme.user_data)
-    add_path(tbl, 'PID files', directory_scheme.pids)
-    add_path(tbl, 'Recipes', directory_scheme.recipes)
+    for description, path in _site_dirs():
+        add_path(tbl, description, path)
     console.print(Panel(tbl, title='[title]Saturnin directories',
                         title_align='left', box=box.ROUNDED))
 
@@ -248,6 +257,7 @@ def edit_config(config_file: _Configs = typer.Argument(..., help="Configuration
                                                    autocompletion=path_completer)):
     """Edit configuration file.
     """
+    from saturnin.base import saturnin_config # pylint: disable=C0415
     edited = typer.edit(config_file.path.read_text(), saturnin_config.editor.value,
                         extension=config_file.path.suffix)
     if edited is not None:
@@ -264,6 +274,7 @@ def create_config(config_file: _Configs= \
     """
     config: str = None
     if config_file in (_Configs.MAIN, _Configs.USER):
+        from saturnin.base import saturnin_config # pylint: disable=C0415
         config = CONFIG_HDR + saturnin_config.get_config()
     elif config_file is _Configs.THEME:
         config = DEFAULT_THEME.config
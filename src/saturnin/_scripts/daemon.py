@@ -40,10 +40,8 @@
 """
 
 from __future__ import annotations
-import platform
 import argparse
 from pathlib import Path
-from saturnin.lib.daemon import start_daemon
 
 def main():
     """Saturnin script to start or stop the daemon process.
@@ -96,24 +94,27 @@ def main():
     args = parser.parse_args()
     try:
         if args.action == 'start':
-            if args.pid_file:
-                pid_file = Path(args.pid_file)
-                pid_file.write_text('') # ensure it's writtable
-            else:
-                pid_file = None
-            args.arguments.insert(0, args.daemon)
-            pid = start_daemon(args.arguments)
-            if not pid:
-                parser.exit(1, "Daemon start operation failed")
-            if pid_file:
-                pid_file.write_text(str(pid))
-            else:
-                print('Daemon PID:', pid)
+            from saturnin.lib.daemon import start_daemon
+            # Open the PID file before the daemon is started to ensure it's writtable
+            pid_file = None if args.pid_file is None else open(args.pid_file, 'w')
+            try:
+                args.arguments.insert(0, args.daemon)
+                pid = start_daemon(args.arguments)
+                if not pid:
+                    parser.exit(1, "Daemon start operation failed")
+                if pid_file:
+                    pid_file.write(str(pid))
+                else:
+                    print('Daemon PID:', pid)
+            finally:
+                if pid_file:
+                    pid_file.close()
         else: # stop
             try:
                 pid = int(args.pid)
             except ValueError:
                 pid = int(Path(args.pid).read_text())
+            import platform
             if platform.system() == 'Windows':
                 import ctypes
                 kernel = ctypes.windll.kernel32
@@ -32,29 +32,41 @@
 #
 # Contributor(s): Pavel Císař (original code)
 #                 ______________________________________
+# pylint: disable=C0415
 
 """Saturnin script to run one service in main or separate thread
 
 """
 
 from __future__ import annotations
-from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter, Action
-from configparser import ConfigParser, ExtendedInterpolation
+from typing import Dict
+from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
+from configparser import ConfigParser, ExtendedInterpolation, InterpolationError, DEFAULTSECT
 import logging
-from logging.config import fileConfig
-from firebird.base.logging import get_logger, Logger, bind_logger, ANY
-from firebird.base.trace import trace_manager
+from saturnin._scripts import LOG_LEVELS
 from saturnin.base import directory_scheme, SECTION_SERVICE
-from saturnin.component.controller import Outcome
-from saturnin.component.single import SingleExecutor
 
 LOG_FORMAT = '%(levelname)s [%(processName)s/%(threadName)s] [%(agent)s:%(context)s] %(message)s'
 
-class UpperAction(Action):
-    """Converts argument to uppercase.
+def _resolve_config(config: ConfigParser) -> ConfigParser:
+    """Returns `~configparser.ConfigParser` without interpolation, with values from `config`
+    interpolated once. Values that could not be interpolated are kept as they are.
+
+    Arguments:
+      config: ConfigParser with `~configparser.ExtendedInterpolation`.
     """
-    def __call__(self, parser, namespace, values, option_string=None):
-        setattr(namespace, self.dest, values.upper())
+    def resolve(section: str) -> Dict[str, str]:
+        result = {}
+        for option, raw in config.items(section, raw=True):
+            try:
+                result[option] = config.get(section, option)
+            except InterpolationError:
+                result[option] = raw
+        return result
+    resolved = ConfigParser(interpolation=None)
+    resolved.read_dict({DEFAULTSECT: resolve(DEFAULTSECT)})
+    resolved.read_dict({section: resolve(section) for section in config.sections()})
+    return resolved
 
 def main(description: str=None, service_config: str=None):
     """Saturnin script to run one service, either unmanaged in main thread, or managed in
@@ -67,7 +79,7 @@ def main(description: str=None, service_config: str=None):
     usage::
 
       saturnin-service [-h] [-c CONFIG] [-s SECTION] [-q] [-o] [--main-thread]
-                       [-l {critical,fatal,error,warn,warning,info,debug,notset}]
+                       [-l {CRITICAL,FATAL,ERROR,WARN,WARNING,INFO,DEBUG,NOTSET}]
                        SERVICE-CONFIG
 
     positional arguments:
@@ -82,8 +94,8 @@ def main(description: str=None, service_config: str=None):
       -q, --quiet           Suppress console output (default: False)
       -o, --outcome         Always print service execution outcome (default: False)
       --main-thread         Start the service in main thread (default: False)
-      -l {critical,fatal,error,warn,warning,info,debug,notset}, --log-level {critical,fatal,error,warn,warning,info,debug,notset}
-                            Logging level (default: None)
+      -l {CRITICAL,FATAL,ERROR,WARN,WARNING,INFO,DEBUG,NOTSET}, --log-level {CRITICAL,FATAL,ERROR,WARN,WARNING,INFO,DEBUG,NOTSET}
+                            Logging level, case insensitive (default: None)
     """
     if description is None:
         description = "Saturnin script to run one service, either unmanaged in main thread, or managed in separate thread."
@@ -104,13 +116,18 @@ def main(description: str=None, service_config: str=None):
                         help="Always print service execution outcome", default=False)
     parser.add_argument('--main-thread', action='store_true',
                         help="Start the service in main thread", default=False)
-    parser.add_argument('-l', '--log-level', action=UpperAction,
-                        choices=[x.lower() for x in logging._nameToLevel
-                                 if isinstance(x, str)],
-                        help="Logging level")
+    parser.add_argument('-l', '--log-level', type=str.upper, choices=LOG_LEVELS,
+                        help="Logging level, case insensitive")
 
     args = parser.parse_args()
 
+    # Imports that are not needed to process command-line arguments (i.e. for --help)
+    from logging.config import fileConfig
+    from firebird.base.logging import get_logger, Logger, bind_logger, ANY
+    from firebird.base.trace import trace_manager
+    from saturnin.component.controller import Outcome
+    from saturnin.component.single import SingleExecutor
+
     main_config: ConfigParser = ConfigParser(interpolation=ExtendedInterpolation())
     cfg_files = [str(directory_scheme.logging_conf)]
     if args.config:
@@ -120,6 +137,8 @@ def main(description: str=None, service_config: str=None):
     else:
         cfg_files.append(args.service)
     cfg_files = main_config.read(cfg_files)
+    # Logging and trace configuration read the same values repeatedly
+    main_config = _resolve_config(main_config)
     # Logging configuration
     if main_config.has_section('loggers'):
         fileConfig(main_config)
@@ -53,7 +53,14 @@ from .transport import (ChannelManager, Channel, Message, SimpleMessage, Protoco
      TZMQMessage, TMessageHandler, TSocketOptions, INTERNAL_ROUTE)
 from .component import Component, ComponentConfig, create_config
 from .config import (SaturninConfig, SaturninScheme, CONFIG_HDR,
-                     directory_scheme, saturnin_config, venv, is_virtual)
+                     directory_scheme, venv, is_virtual)
 
 #: Saturnin version
 VERSION = '0.9.0'
+
+def __getattr__(name: str):
+    # `saturnin_config` is loaded on first access, see `saturnin.base.config`
+    if name == 'saturnin_config':
+        from . import config # pylint: disable=C0415
+        return config.saturnin_config
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
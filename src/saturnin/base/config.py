@@ -38,11 +38,14 @@
 """
 
 from __future__ import annotations
-from typing import Optional, List, Final
+from typing import Optional, Union, List, Tuple, Final
 import sys
 import os
 import sysconfig
+from threading import Lock
 from pathlib import Path
+from contextlib import suppress
+from functools import cached_property
 from configparser import ConfigParser, ExtendedInterpolation
 from firebird.base.config import DirectoryScheme, get_directory_scheme, Config, StrOption
 
@@ -74,6 +77,10 @@ WINDOWS: Final[bool] = sys.platform == "win32"
 #: True if current platform is based on MINGW
 MINGW: Final[bool] = sysconfig.get_platform().startswith("mingw")
 
+#: Names of `SaturninScheme` properties with cached values
+_CACHED_PATHS: Final[Tuple[str, ...]] = ('pids', 'site_services_toml', 'site_apps_toml',
+                                         'site_oids_toml', 'site_conf', 'user_conf')
+
 class SaturninScheme(DirectoryScheme):
     """Saturnin platform directory scheme.
 
@@ -81,15 +88,24 @@ class SaturninScheme(DirectoryScheme):
     environment that contains `home` subdirectory, it's set as Saturnin HOME directory.
 
     This `home` subdirectory is created by `saturnin create home` command on request.
+
+    Paths to PID directory, registry files and Saturnin configuration files are computed
+    only once, on first access. They are computed again when base directory they are derived
+    from is changed.
+
+    Important:
+        Directories must be changed only via properties. Direct changes to `dir_map` are
+        not detected, and cached paths derived from changed directory are not updated.
     """
     def __init__(self):
-        super().__init__('saturnin')
-        if not self.has_home_env() and is_virtual():
+        # Must be set before DirectoryScheme initialization that reads SATURNIN_HOME
+        if os.getenv('SATURNIN_HOME') is None and is_virtual():
             home_dir: Path = venv() / 'home'
             if home_dir.is_dir():
                 os.environ['SATURNIN_HOME'] = str(home_dir)
+        super().__init__('saturnin')
         self.dir_map.update(get_directory_scheme('saturnin').dir_map)
-        self.__pip_path: Path = 'pip'
+        self.__pip_path: Optional[Path] = Path('pip')
         self.__pip_cmd: List[str] = ['pip']
         if is_virtual():
             root = venv()
@@ -107,6 +123,30 @@ class SaturninScheme(DirectoryScheme):
                 # No pip shortcut in venv, we must relly on python -m to run it, typical for pipx
                 self.__pip_path = None
                 self.__pip_cmd = [str(python_path), '-m', 'pip']
+    def _reset_paths(self) -> None:
+        "Drops cached paths, so they are computed again on next access."
+        for name in _CACHED_PATHS:
+            self.__dict__.pop(name, None)
+    @DirectoryScheme.home.setter
+    def home(self, value: Union[Path, str]) -> None:
+        DirectoryScheme.home.fset(self, value)
+        self._reset_paths()
+    @DirectoryScheme.config.setter
+    def config(self, path: Path) -> None:
+        DirectoryScheme.config.fset(self, path)
+        self._reset_paths()
+    @DirectoryScheme.data.setter
+    def data(self, path: Path) -> None:
+        DirectoryScheme.data.fset(self, path)
+        self._reset_paths()
+    @DirectoryScheme.run_data.setter
+    def run_data(self, path: Path) -> None:
+        DirectoryScheme.run_data.fset(self, path)
+        self._reset_paths()
+    @DirectoryScheme.user_config.setter
+    def user_config(self, path: Path) -> None:
+        DirectoryScheme.user_config.fset(self, path)
+        self._reset_paths()
     def get_pip_cmd(self, *args) -> List[str]:
         """Returns list with command to run pip.
 
@@ -121,32 +161,32 @@ class SaturninScheme(DirectoryScheme):
         """Path to directory with recipe files.
         """
         return self.data / 'recipes'
-    @property
+    @cached_property
     def pids(self) -> Path:
         """Path to directory with PID files for running daemons.
         """
         return self.run_data / 'pids'
-    @property
+    @cached_property
     def site_services_toml(self) -> Path:
         """Saturnin service registry file.
         """
         return self.data / 'services.toml'
-    @property
+    @cached_property
     def site_apps_toml(self) -> Path:
         """Saturnin application registry file.
         """
         return self.data / 'apps.toml'
-    @property
+    @cached_property
     def site_oids_toml(self) -> Path:
         """Saturnin OID registry file.
         """
         return self.data / 'oids.toml'
-    @property
+    @cached_property
     def site_conf(self) -> Path:
         """Saturnin site configuration file.
         """
         return self.config / SATURNIN_CFG
-    @property
+    @cached_property
     def user_conf(self) -> Path:
         """Saturnin user configuration file.
         """
@@ -177,8 +217,8 @@ class SaturninScheme(DirectoryScheme):
         """
         return self.config / 'theme.conf'
     @property
-    def pip_path(self) -> Path:
-        """Path to `pip`.
+    def pip_path(self) -> Optional[Path]:
+        """Path to `pip`, or None when pip must be run as `python -m pip`.
         """
         return self.__pip_path
 
@@ -191,31 +231,57 @@ class SaturninConfig(Config):
         self.editor: StrOption = StrOption('editor', "External editor",
                                            default=os.getenv('EDITOR'))
 
+# Check supports venv && virtualenv >= 20.0.0
+_VENV: Final[Optional[Path]] = Path(sys.prefix) if sys.base_prefix != sys.prefix else None
+
 def is_virtual() -> bool:
     """Returns True if Saturnin runs in a virtual environtment.
     """
-    # Check supports venv && virtualenv >= 20.0.0
-    return getattr(sys, 'base_prefix', sys.prefix) != sys.prefix
+    return _VENV is not None
 
 def venv() -> Optional[Path]:
     """Path to Saturnin virtual environment.
     """
-    return Path(sys.prefix) if is_virtual() else None
-
-# Set SATURNIN_HOME if defined in virtual environment
-if is_virtual():
-    path: Path = venv() / 'home'
-    if path.is_dir():
-        os.environ['SATURNIN_HOME'] = str(path)
+    return _VENV
 
 #: Active Saturnin directory scheme
 directory_scheme: SaturninScheme = SaturninScheme()
 
-#: Saturnin configuration object
-saturnin_config: SaturninConfig = SaturninConfig()
+#: Saturnin configuration object (created and loaded from configuration files on first access)
+saturnin_config: SaturninConfig
+
+_config_lock: Lock = Lock()
+
+def _load_saturnin_config() -> SaturninConfig:
+    """Returns Saturnin configuration object loaded from site and user configuration files.
+    """
+    config: SaturninConfig = SaturninConfig()
+    # Files are read only once, and missing or unreadable files are skipped like in
+    # ConfigParser.read()
+    sources: List[Tuple[str, str]] = []
+    for path in (directory_scheme.site_conf, directory_scheme.user_conf):
+        with suppress(OSError):
+            sources.append((path.read_text(), str(path)))
+    # Interpolation is used only when some value actually contains '$'
+    parser: ConfigParser = ConfigParser(interpolation=None)
+    for text, source in sources:
+        parser.read_string(text, source)
+    if any('$' in value for section in parser.sections()
+           for _, value in parser.items(section, raw=True)):
+        parser = ConfigParser(interpolation=ExtendedInterpolation())
+        for text, source in sources:
+            parser.read_string(text, source)
+    if parser.has_section('saturnin'):
+        config.load_config(parser)
+    return config
 
-parser: ConfigParser = ConfigParser(interpolation=ExtendedInterpolation())
-parser.read([directory_scheme.site_conf, directory_scheme.user_conf])
-if parser.has_section('saturnin'):
-    saturnin_config.load_config(parser)
-del parser
+def __getattr__(name: str):
+    if name == 'saturnin_config':
+        global saturnin_config # pylint: disable=W0601
+        with _config_lock:
+            # Another thread could load it while we were waiting for the lock
+            config = globals().get('saturnin_config')
+            if config is None:
+                config = saturnin_config = _load_saturnin_config()
+        return config
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -47,17 +47,17 @@ The messaging framework consists from:
 """
 
 from __future__ import annotations
-from typing import  Union, Dict, List, Iterable, Callable, Optional, Type, Any, Final
+from typing import  Union, Dict, List, Set, Tuple, Iterable, Callable, Optional, Type, Any, Final
 from abc import ABC, abstractmethod
-from weakref import proxy
 from contextlib import suppress
+import os
 import uuid
 import warnings
 import zmq
 from zmq import Frame, ZMQError, Again, POLLIN, POLLOUT
 from firebird.base.types import ZMQAddress, DEFAULT, UNDEFINED, ANY
 from firebird.base.signal import eventsocket
-from firebird.base.logging import LoggingIdMixin
+from firebird.base.logging import LoggingIdMixin, get_logger
 from firebird.base.trace import TracedMixin
 from .types import (RoutingID, SocketMode, SocketType, Direction, InvalidMessageError,
     ChannelError, INVALID, TIMEOUT)
@@ -75,6 +75,19 @@ TMessageHandler = Callable[['Channel', 'Session', 'Message'], None]
 #: Internal routing ID
 INTERNAL_ROUTE: Final[RoutingID] = b'INTERNAL'
 
+#: Poll event flags mapped to `.Direction` members
+_DIRECTIONS: Final[Dict[int, Direction]] = {d.value: d for d in Direction.__members__.values()}
+
+#: `SimpleMessage.get_keys` result for message without data
+_NO_DATA_KEYS: Final[Tuple[None, Any]] = (None, ANY)
+
+def _new_routing_id() -> RoutingID:
+    """Returns new random 16-byte routing ID. Routing IDs starting with zero byte are
+    reserved by ZeroMQ, so the first byte is never zero.
+    """
+    rid = os.urandom(16)
+    return rid if rid[0] else b'\x01' + rid[1:]
+
 class ChannelManager(LoggingIdMixin, TracedMixin):
     """Manager of ZeroMQ communication channels.
     """
@@ -89,9 +102,12 @@ class ChannelManager(LoggingIdMixin, TracedMixin):
         self.channels: Dict[str, Channel] = {}
         #: Logging context
         self.log_context: Any = UNDEFINED
+        #: Maximum number of messages received from single channel in one I/O loop cycle
+        self.batch_size: int = 16
         self._poller: zmq.Poller = None
         self._chmap: Dict[zmq.Socket, Channel] = {}
-        self._pollout: bool = False
+        #: Number of channels that wait for `Direction.OUT`
+        self._pollout_count: int = 0
     def create_channel(self, cls: Type[Channel], name: str, protocol: Protocol, *,
                        routing_id: RoutingID=DEFAULT, session_type: Type[Session]=DEFAULT,
                        wait_for: Direction=Direction.NONE,
@@ -115,19 +131,26 @@ class ChannelManager(LoggingIdMixin, TracedMixin):
         chn: Channel = cls(self, name, protocol, routing_id, session_type, wait_for,
                            snd_timeout, rcv_timeout, linger, sock_opts)
         self.channels[chn.name] = chn
+        if Direction.OUT in wait_for:
+            self._pollout_count += 1
         return chn
     def update_poller(self, channel: Channel, value: Direction) -> None:
         """Update poller registration for channel.
+
+        Important:
+            Must be called *before* new value is assigned to `Channel.wait_for`.
+
+        Arguments:
+            channel: Channel with changed `~Channel.wait_for`.
+            value: New `~Channel.wait_for` value.
         """
-        self._pollout = False
-        for chn in self.channels.values():
-            self._pollout = self._pollout or Direction.OUT in chn.wait_for
+        self._pollout_count += (Direction.OUT in value) - (Direction.OUT in channel.wait_for)
         if self._poller is not None:
             self._poller.modify(channel.socket, value.value)
     def has_pollout(self) -> bool:
         """Returns True if :meth:`wait` will check for POLLOUT event on any channel.
         """
-        return self._pollout
+        return self._pollout_count > 0
     def wait(self, timeout: int=None) -> Dict[Channel, Direction]:
         """Wait for I/O events on channnels.
 
@@ -139,22 +162,29 @@ class ChannelManager(LoggingIdMixin, TracedMixin):
         """
         if self._poller is None:
             self._poller = zmq.Poller()
-            self._pollout = False
+            self._pollout_count = sum(1 for chn in self.channels.values()
+                                      if Direction.OUT in chn.wait_for)
             for chn in self.channels.values():
-                self._pollout = self._pollout or Direction.OUT in chn.wait_for
                 self._poller.modify(chn.socket, chn.wait_for.value)
-        return {self._chmap[socket]: Direction(e) for socket, e in self._poller.poll(timeout)}
+        chmap = self._chmap
+        directions = _DIRECTIONS
+        return {chmap[socket]: directions[e] for socket, e in self._poller.poll(timeout)}
     def warm_up(self) -> None:
         """Create and set up ZMQ sockets for all registered channels that does not have socket.
+        Channels detached by `shutdown()` are attached to manager again.
         """
         for chn in self.channels.values():
+            chn._mngr = self # pylint: disable=W0212
             if chn.socket is None:
                 chn.set_socket(self.ctx.socket(chn.socket_type.value))
                 self._chmap[chn.socket] = chn
+        self._pollout_count = sum(1 for chn in self.channels.values()
+                                  if Direction.OUT in chn.wait_for)
     def shutdown(self, *, forced: bool=False) -> None:
         """Close all managed channels.
 
-        Calls unbind/disconnect on active channels, and clears all sessions.
+        Calls unbind/disconnect on active channels, and clears all sessions. Channels are
+        also detached from manager (see `Channel.manager`) until next `warm_up()`.
 
         Arguments:
             forced: When True, channels are closed with zero LINGER and all ZMQ errors are
@@ -176,11 +206,16 @@ class ChannelManager(LoggingIdMixin, TracedMixin):
                 chn.drop_socket()
             else:
                 chn.close_socket()
+            # Break the reference cycle between manager and channel
+            chn._mngr = None # pylint: disable=W0212
+        # Poller is created again for new sockets by next wait()
+        self._poller = None
 
 
 class Message(ABC):
     """Abstract base class for protocol message.
     """
+    __slots__ = ()
     def __str__(self):
         return self.__class__.__qualname__
     __repr__ = __str__
@@ -216,6 +251,7 @@ class SimpleMessage(Message):
     """Simple protocol message that holds items from ZMQ multipart message in its
     :attr:`.data` attribute.
     """
+    __slots__ = ('data',)
     def __init__(self):
         #: Sequence of data frames
         self.data: List[bytes] = []
@@ -255,14 +291,19 @@ class SimpleMessage(Message):
     def get_keys(self) -> Iterable:
         """Returns iterable of dictionary keys to be used with `Protocol.handlers`.
 
-        The default implementation returns list with first data frame or None followed by
+        The default implementation returns tuple with first data frame or None followed by
         `~firebird.base.types.ANY` sentinel.
         """
-        return [self.data[0] if self.data else None, ANY]
+        return (self.data[0], ANY) if self.data else _NO_DATA_KEYS
 
 class Session:
     """Base Peer Session class.
+
+    Important:
+        Session uses `__slots__`, so protocols that need to store additional information
+        in session must use `Session` subclass with these attributes.
     """
+    __slots__ = ('routing_id', 'endpoint', 'send_pending', '_logging_id_')
     def __init__(self):
         #: Channel routing ID for connected peer
         self.routing_id: RoutingID = None
@@ -279,6 +320,21 @@ class Session:
         return getattr(self, '_logging_id_',
                        f'{self.__class__.__name__}[{self.routing_id}:{self.endpoint}]')
 
+class _DirectEventSocket(eventsocket):
+    """`~firebird.base.signal.eventsocket` that also keeps the slot wrapper of connected
+    callable (or None) in instance attribute with the event name prefixed by underscore,
+    so hot paths could call it directly without eventsocket indirection.
+
+    Note:
+        The wrapper is the same object used by `eventsocket`, so connected methods and
+        functions are still referenced weakly. Call to wrapper with dead target returns None.
+    """
+    def __set_name__(self, owner, name):
+        self._attr: str = '_' + name
+    def __set__(self, obj, value):
+        super().__set__(obj, value)
+        setattr(obj, self._attr, self._map.get(obj))
+
 class Protocol(TracedMixin):
     """Base class for protocol.
 
@@ -294,6 +350,8 @@ class Protocol(TracedMixin):
     UID: uuid.UUID = uuid.uuid5(uuid.NAMESPACE_OID, OID)
     #: Protocol revision (default 1)
     REVISION: int = 1
+    #: Weak slot wrapper of callable connected to `message_factory`
+    _message_factory: Optional[TMessageFactory] = None
     def __init__(self, *, session_type: Type[Session]=Session):
         """
         Arguments:
@@ -351,7 +409,7 @@ class Protocol(TracedMixin):
         Raises:
             InvalidMessageError: If message is not a valid protocol message.
         """
-        msg = self.message_factory(zmsg)
+        msg = self._message_factory(zmsg)
         msg.from_zmsg(zmsg)
         return msg
     def accept_new_session(self, channel: Channel, routing_id: RoutingID, msg: Message) -> bool: # pylint: disable=W0613
@@ -402,8 +460,9 @@ class Protocol(TracedMixin):
             Whatever handler returns, or None when handler raises an exception.
         """
         handler: TMessageHandler = None
+        get_handler = self.handlers.get
         for key in msg.get_keys():
-            if handler := self.handlers.get(key):
+            if handler := get_handler(key):
                 break
         try:
             assert handler, "Message without handler"
@@ -447,7 +506,7 @@ class Protocol(TracedMixin):
             exc:     Exception raised while processing the message
         """
         self.on_exception(channel, session, msg, exc)
-    @eventsocket
+    @_DirectEventSocket
     def message_factory(self, zmsg: TZMQMessage=None) -> Message:
         """`~firebird.base.signal.eventsocket` for message factory that must return protocol
         message instance. The default factory produces new `SimpleMessage` instance on each
@@ -505,7 +564,20 @@ class Protocol(TracedMixin):
 
 class Channel(TracedMixin):
     """Base Class for ZMQ communication channel (socket).
+
+    Note:
+        Attributes defined by this class are stored in slots, instance `__dict__` (inherited
+        from `TracedMixin`) is used only for attributes added by descendants or tracing.
     """
+    __slots__ = ('_mngr', '_name', '_routing_id', '_protocol', '_session_type',
+                 '_snd_timeout', '_rcv_timeout', '_linger', '_wait_for', '_mode',
+                 '_socket_type', '_direction', 'socket', 'sock_opts', 'routed',
+                 '_inline_convert', 'endpoints', '_endpoint_set', 'sessions')
+    #: Weak slot wrappers of callables connected to transmission error events
+    _on_send_failed: Optional[Callable[..., bool]] = None
+    _on_send_later: Optional[Callable[..., bool]] = None
+    _on_receive_failed: Optional[Callable[..., bool]] = None
+    _on_receive_later: Optional[Callable[..., bool]] = None
     def __init__(self, mngr: ChannelManager, name: str, protocol: Protocol,
                  routing_id: RoutingID, session_type: Type[Session], wait_for: Direction,
                  snd_timeout: int, rcv_timeout: int, linger: int, sock_opts: TSocketOptions):
@@ -523,10 +595,10 @@ class Channel(TracedMixin):
             linger: ZMQ socket linger period.
             sock_opts: Dictionary with socket options that should be set after socket creation.
         """
-        self._mngr: ChannelManager = proxy(mngr)
+        self._mngr: ChannelManager = mngr
         self._name = name
         self._routing_id: RoutingID = \
-            uuid.uuid1().hex.encode() if routing_id is DEFAULT else routing_id
+            _new_routing_id() if routing_id is DEFAULT else routing_id
         self._protocol: Protocol = protocol
         self._session_type: Type[Session] = \
             protocol.session_type if session_type is DEFAULT else session_type
@@ -543,8 +615,12 @@ class Channel(TracedMixin):
         self.sock_opts: TSocketOptions = sock_opts or {}
         #: True if channel uses internal routing
         self.routed: bool = False
+        # True if protocol does not override `Protocol.convert_msg`
+        self._inline_convert: bool = type(protocol).convert_msg is Protocol.convert_msg
         #: List of binded/connected endpoints
         self.endpoints: List[ZMQAddress] = []
+        # Set with `endpoints` for fast membership tests
+        self._endpoint_set: Set[ZMQAddress] = set()
         #: Dictionary of active sessions, key=routing_id
         self.sessions: Dict[RoutingID, Session] = {}
         self._adjust()
@@ -562,15 +638,25 @@ class Channel(TracedMixin):
         """
         assert self.socket is None, "Channel socket is already set"
         self.socket = socket
+        set_opt = socket.set
         if self._routing_id:
-            self.socket.routing_id = self._routing_id
-        self.socket.immediate = 1
-        self.socket.sndtimeo = self._snd_timeout
-        self.socket.rcvtimeo = self._rcv_timeout
-        self.socket.linger = self._linger
+            set_opt(zmq.ROUTING_ID, self._routing_id)
+        set_opt(zmq.IMMEDIATE, 1)
+        set_opt(zmq.SNDTIMEO, self._snd_timeout)
+        set_opt(zmq.RCVTIMEO, self._rcv_timeout)
+        set_opt(zmq.LINGER, self._linger)
         if self.sock_opts:
             for name, value in self.sock_opts.items():
-                setattr(self.socket, name, value)
+                if hasattr(type(socket), name):
+                    # Socket properties that are not plain options (like 'hwm')
+                    setattr(socket, name, value)
+                else:
+                    try:
+                        option = zmq.SocketOption[name.upper()]
+                    except KeyError:
+                        raise AttributeError(f"Socket has no such option: {name.upper()}") \
+                              from None
+                    set_opt(option, value)
         self._configure()
     def _configure(self) -> None:
         """Called by `.set_socket()` to configure the 0MQ socket.
@@ -646,12 +732,13 @@ class Channel(TracedMixin):
         assert self.mode != SocketMode.CONNECT
         if (self.socket.socket_type == SocketType.PAIR) and self.endpoints:
             raise ChannelError("Cannot open multiple endpoints for PAIR socket")
-        if endpoint in self.endpoints:
+        if endpoint in self._endpoint_set:
             raise ChannelError(f"Endpoint '{endpoint}' already openned")
         self.socket.bind(endpoint)
         endpoint = ZMQAddress(str(self.socket.last_endpoint, 'utf8'))
         self._mode = SocketMode.BIND
         self.endpoints.append(endpoint)
+        self._endpoint_set.add(endpoint)
         return endpoint
     def unbind(self, endpoint: ZMQAddress=None) -> None:
         """Unbind from an address (undoes a call to `bind()`).
@@ -665,12 +752,13 @@ class Channel(TracedMixin):
         """
         assert self.socket is not None
         assert self.mode == SocketMode.BIND
-        if endpoint and endpoint not in self.endpoints:
+        if endpoint and endpoint not in self._endpoint_set:
             raise ChannelError(f"Endpoint '{endpoint}' not binded")
         addrs = [endpoint] if endpoint else list(self.endpoints)
         for addr in addrs:
             self.socket.unbind(addr)
             self.endpoints.remove(addr)
+            self._endpoint_set.discard(addr)
         if not self.endpoints:
             self._mode = SocketMode.UNKNOWN
     def connect(self, endpoint: ZMQAddress, *, routing_id: RoutingID=None) -> Optional[Session]:
@@ -691,7 +779,7 @@ class Channel(TracedMixin):
         assert self.mode != SocketMode.BIND
         if (self.socket.socket_type == SocketType.PAIR) and self.endpoints:
             raise ChannelError("Cannot connect multiple endpoints for PAIR socket")
-        if endpoint in self.endpoints:
+        if endpoint in self._endpoint_set:
             raise ChannelError(f"Endpoint '{endpoint}' already connected")
         if self.routed:
             assert routing_id
@@ -706,6 +794,7 @@ class Channel(TracedMixin):
         self.socket.connect(endpoint)
         self._mode = SocketMode.CONNECT
         self.endpoints.append(endpoint)
+        self._endpoint_set.add(endpoint)
         return session
     def disconnect(self, endpoint: ZMQAddress=None) -> None:
         """Disconnect from a remote socket (undoes a call to `connect()`).
@@ -724,12 +813,13 @@ class Channel(TracedMixin):
         """
         assert self.socket is not None
         assert self.mode == SocketMode.CONNECT
-        if endpoint and endpoint not in self.endpoints:
+        if endpoint and endpoint not in self._endpoint_set:
             raise ChannelError(f"Endpoint '{endpoint}' not openned")
         addrs = [endpoint] if endpoint else list(self.endpoints)
         for addr in addrs:
             self.socket.disconnect(addr)
             self.endpoints.remove(addr)
+            self._endpoint_set.discard(addr)
         if not self.endpoints:
             self._mode = SocketMode.UNKNOWN
     def can_send(self, timeout: int=0) -> bool:
@@ -763,18 +853,16 @@ class Channel(TracedMixin):
             Zero for success, or ZMQ error code.
         """
         result = 0
-        zmsg = msg.as_zmsg()
-        if self.routed:
-            zmsg.insert(0, session.routing_id)
+        zmsg = [session.routing_id, *msg.as_zmsg()] if self.routed else msg.as_zmsg()
         try:
             self.send_zmsg(zmsg)
         except Again as exc:
-            if self.on_send_later.is_set() and self.on_send_later(self, session, msg): # pylint: disable=E1101
+            if self._on_send_later is not None and self._on_send_later(self, session, msg):
                 result = 0
             else:
                 result = exc.errno
         except ZMQError as exc:
-            if self.on_send_failed.is_set() and self.on_send_failed(self, session, msg, exc.errno): # pylint: disable=E1101
+            if self._on_send_failed is not None and self._on_send_failed(self, session, msg, exc.errno):
                 result = 0
             else:
                 result = exc.errno
@@ -793,7 +881,7 @@ class Channel(TracedMixin):
 
         If protocol raises `InvalidMessageError` on message conversion, it calls
         `Protocol.on_invalid_msg` event handler (if defined) before message is dropped.
-        Exceptions raised by event handler are ignored, only `RuntimeWarning` is emitted.
+        Exceptions raised by event handler are ignored, only logged as warning.
 
         If there is no session found for route, it first calls `Protocol.accept_new_session()`,
         and message is handled only when new session is accepted.
@@ -814,32 +902,98 @@ class Channel(TracedMixin):
         try:
             zmsg = self.receive_zmsg()
         except Again:
-            if not (self.on_receive_later.is_set() and self.on_receive_later(self)): # pylint: disable=E1101
+            if not (self._on_receive_later is not None and self._on_receive_later(self)):
                 raise
             return INVALID
         except ZMQError as exc:
-            if not (self.on_receive_failed.is_set() and self.on_receive_failed(self, exc.errno)): # pylint: disable=E1101
+            if not (self._on_receive_failed is not None and self._on_receive_failed(self, exc.errno)):
                 raise
             return INVALID
+        return self._handle_zmsg(zmsg)
+    def receive_batch(self, max_count: int=16, timeout: int=None) -> List[Any]:
+        """Wait for message and then receive and process all immediately available protocol
+        messages, up to `max_count`.
+
+        Arguments:
+             max_count: Maximum number of messages processed by single call.
+             timeout: The timeout (in milliseconds) to wait for first message. `None`
+                      value means `infinite`.
+
+        Returns:
+            List with results for processed messages (see `.receive()` for details). Empty
+            list when timeout expires.
+        """
+        if self.socket.poll(timeout, POLLIN) == 0:
+            return []
+        return self.try_recv_batch(max_count)
+    def try_recv_batch(self, max_count: int=16, *,
+                       stop: Callable[[], bool]=None) -> List[Any]:
+        """Receive and process protocol messages that are immediately available, without
+        blocking and without polling the socket first.
+
+        Messages are received until socket reports `zmq.Again`, `max_count` messages are
+        processed, message handler changes :attr:`wait_for`, or `stop` returns True.
+        Each message is processed in the same way as by `.receive()`.
+
+        Arguments:
+             max_count: Maximum number of messages processed by single call.
+             stop: Callable checked after each processed message. The batch ends when it
+                   returns True.
+
+        Returns:
+            List with results for processed messages (see `.receive()` for details).
+        """
+        assert self.socket is not None
+        assert Direction.IN in self.direction, "Call to receive() on SEND-only channel"
+        result = []
+        recv = self.socket.recv_multipart
+        wait_for = self._wait_for
+        while len(result) < max_count:
+            try:
+                zmsg = recv(zmq.NOBLOCK)
+            except Again:
+                break
+            except ZMQError as exc:
+                if not (self._on_receive_failed is not None and self._on_receive_failed(self, exc.errno)):
+                    raise
+                result.append(INVALID)
+                break
+            result.append(self._handle_zmsg(zmsg))
+            if self._wait_for is not wait_for or (stop is not None and stop()):
+                break
+        return result
+    def _handle_zmsg(self, zmsg: TZMQMessage) -> Any:
+        """Process received ZMQ multipart message with assigned protocol.
+
+        Arguments:
+            zmsg: Received ZMQ multipart message.
+        """
         routing_id: RoutingID = zmsg.pop(0) if self.routed else INTERNAL_ROUTE
         session = self.sessions.get(routing_id)
+        protocol = self._protocol
         #
         try:
-            msg = self._protocol.convert_msg(zmsg)
+            if self._inline_convert:
+                # Same as Protocol.convert_msg(), without extra call
+                msg = protocol._message_factory(zmsg) # pylint: disable=W0212
+                msg.from_zmsg(zmsg)
+            else:
+                msg = protocol.convert_msg(zmsg)
         except InvalidMessageError as exc:
             try:
-                self._protocol.handle_invalid_msg(self, session, exc)
+                protocol.handle_invalid_msg(self, session, exc)
             except Exception: # pylint: disable=W0703
-                warnings.warn('Exception raised in invalid message handler', RuntimeWarning)
+                get_logger(self).warning('Exception raised in invalid message handler',
+                                         exc_info=True)
             return INVALID
         #
         if session is None:
             # This is the first message received for transmission with this peer
-            if not self._protocol.accept_new_session(self, routing_id, msg):
+            if not protocol.accept_new_session(self, routing_id, msg):
                 return INVALID
             session = self.create_session(routing_id)
         #
-        return self._protocol.handle_msg(self, session, msg)
+        return protocol.handle_msg(self, session, msg)
     def receive_zmsg(self) -> TZMQMessage:
         """Receive ZMQ multipart message.
         """
@@ -856,10 +1010,8 @@ class Channel(TracedMixin):
         Arguments:
            value: `True` to enable incoming messages, `False` to disable.
         """
-        if value:
-            self.wait_for |= Direction.IN
-        else:
-            self.wait_for = (self.wait_for | Direction.IN) ^ Direction.IN
+        flags = self._wait_for.value
+        self.wait_for = _DIRECTIONS[flags | POLLIN if value else flags & ~POLLIN]
     def set_wait_out(self, value: bool, session: Session=None) -> None:
         """Enable/disable sending messages. It sets/clear `Direction.OUT` in `.wait_for`.
 
@@ -877,10 +1029,8 @@ class Channel(TracedMixin):
             if self.routed:
                 raise ChannelError("Session required for routed channel")
             session = self.session
-        if value:
-            self.wait_for |= Direction.OUT
-        else:
-            self.wait_for = (self.wait_for | Direction.OUT) ^ Direction.OUT
+        flags = self._wait_for.value
+        self.wait_for = _DIRECTIONS[flags | POLLOUT if value else flags & ~POLLOUT]
         if session is not None:
             session.send_pending = value
     def wait(self, timeout: int=None) -> Direction:
@@ -891,7 +1041,7 @@ class Channel(TracedMixin):
                      will wait forever for an event.
         """
         assert self.socket is not None
-        return Direction(self.socket.poll(timeout, self._wait_for.value))
+        return _DIRECTIONS[self.socket.poll(timeout, self._wait_for.value)]
     @property
     def name(self) -> str:
         "Channel name."
@@ -909,8 +1059,14 @@ class Channel(TracedMixin):
         "ZMQ Socket mode."
         return self._mode
     @property
-    def manager(self) -> ChannelManager:
-        "The channel manager to which this channel belongs."
+    def manager(self) -> Optional[ChannelManager]:
+        """The channel manager to which this channel belongs.
+
+        Important:
+            Channels are detached from manager by `.ChannelManager.shutdown()`, so this
+            property returns None until the manager is reactivated by
+            `.ChannelManager.warm_up()`.
+        """
         return self._mngr
     @property
     def routing_id(self) -> RoutingID:
@@ -964,19 +1120,22 @@ class Channel(TracedMixin):
         return self._wait_for
     @wait_for.setter
     def wait_for(self, value: Direction) -> None:
-        if not value in self.direction:
+        if value.value & ~self._direction.value:
             raise ChannelError("Cannot wait for events in direction not supported "
                                "by channel for transmission.")
+        if self._mngr is not None:
+            self._mngr.update_poller(self, value)
         self._wait_for = value
-        self._mngr.update_poller(self, value)
     @property
     def logging_id(self) -> str:
         "Returns _logging_id_ or <class_name>[<name>]"
         return getattr(self, '_logging_id_', f'{self.__class__.__name__}[{self.name}]')
     @property
     def log_context(self) -> Any:
-        "Logging context. Returns `log_context` from ChannelManager."
-        return self._mngr.log_context
+        """Logging context. Returns `log_context` from ChannelManager, or `UNDEFINED`
+        when channel is detached from manager (see `.manager`).
+        """
+        return UNDEFINED if self._mngr is None else self._mngr.log_context
     @eventsocket
     def on_output_ready(self, channel: Channel) -> None:
         """`~firebird.base.signal.eventsocket`  called when channel is ready to accept at
@@ -997,7 +1156,7 @@ class Channel(TracedMixin):
             channel: Channel to be shut down.
             forced:  When True, the channel will be closed with zero LINGER and all ZMQ errors will be ignored.
         """
-    @eventsocket
+    @_DirectEventSocket
     def on_send_failed(self, channel: Channel, session: Session, msg: Message, err_code: int) -> bool:
         """`~firebird.base.signal.eventsocket`  called by :meth:`Channel.send` when send
         operation fails with `zmq.ZMQError` exception other than `EAGAIN`.
@@ -1011,7 +1170,7 @@ class Channel(TracedMixin):
             msg: Message that wasn't sent.
             err_code: Error code.
         """
-    @eventsocket
+    @_DirectEventSocket
     def on_send_later(self, channel: Channel, session: Session, msg: Message) -> bool:
         """`~firebird.base.signal.eventsocket`  called by :meth:`Channel.send` when send
         operation fails with `zmq.Again` exception.
@@ -1024,7 +1183,7 @@ class Channel(TracedMixin):
             session: Session associated with failed transmission.
             msg: Message that wasn't sent.
         """
-    @eventsocket
+    @_DirectEventSocket
     def on_receive_failed(self, channel: Channel, err_code: int) -> bool:
         """`~firebird.base.signal.eventsocket`  called by :meth:`Channel.receive` when
         receive operation fails with `zmq.ZMQError` exception other than EAGAIN.
@@ -1036,7 +1195,7 @@ class Channel(TracedMixin):
             channel: Channel where receive operation failed.
             err_code: Error code.
         """
-    @eventsocket
+    @_DirectEventSocket
     def on_receive_later(self, channel: Channel) -> bool:
         """`~firebird.base.signal.eventsocket`  called by :meth:`Channel.receive` when
         receive operation fails with `zmq.Again` exception.
@@ -1119,14 +1278,14 @@ class XSubChannel(Channel):
         Arguments:
             topic: ZMQ topic.
         """
-        self.socket.send_multipart(b'\x01', topic)
+        self.socket.send(b'\x01' + topic)
     def unsubscribe(self, topic: bytes):
         """Unsubscribe to topic.
 
         Arguments:
             topic: ZMQ topic.
         """
-        self.socket.send_multipart(b'\x00', topic)
+        self.socket.send(b'\x00' + topic)
 
 class PairChannel(Channel):
     """Communication channel over PAIR socket.
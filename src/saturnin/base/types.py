@@ -224,6 +224,8 @@ class ButlerInterface(IntEnum):
         raise NotImplementedError()
 
 # Dataclasses
+# Descriptors define `__hash__` explicitly to keep the key-based hash from `Distinct`,
+# otherwise frozen dataclasses generate hash from all fields.
 @dataclass(eq=True, order=False, frozen=True)
 class AgentDescriptor(Distinct):
     """Service or Client descriptor dataclass.
@@ -250,6 +252,7 @@ class AgentDescriptor(Distinct):
     platform_uid: uuid.UUID = PLATFORM_UID
     platform_version: str = PLATFORM_VERSION
     supplement: TSupplement = None
+    __hash__ = Distinct.__hash__
     def get_key(self) -> Any:
         """Returns `uid` (instance key). Used for instance hash computation."""
         return self.uid
@@ -276,6 +279,7 @@ class PeerDescriptor(Distinct):
     pid: int
     host: str
     supplement: TSupplement = None
+    __hash__ = Distinct.__hash__
     def get_key(self) -> Any:
         """Returns `uid` (instance key). Used for instance hash computation."""
         return self.uid
@@ -334,6 +338,7 @@ class ServiceDescriptor(Distinct):
     facilities: List[str]
     factory: str
     config: Callable[[], Config]
+    __hash__ = Distinct.__hash__
     def get_key(self) -> Any:
         """Returns `agent.uid` (instance key). Used for instance hash computation."""
         return self.agent.uid
@@ -360,6 +365,7 @@ class ApplicationDescriptor(Distinct):
     description: str
     factory: str
     config: str
+    __hash__ = Distinct.__hash__
     def get_key(self) -> Any:
         """Returns `uid` (instance key). Used for instance hash computation."""
         return self.uid
@@ -45,11 +45,12 @@ from __future__ import annotations
 from typing import Dict, Hashable, Optional, Any
 from uuid import UUID
 from contextlib import suppress
-from toml import dumps, loads
 from firebird.base.types import Distinct, load
 from firebird.base.collections import Registry
 from saturnin.base import directory_scheme, ApplicationDescriptor, Error
 from saturnin.lib.metadata import get_entry_point_distribution, iter_entry_points
+from saturnin.lib.registry import NameIndexMixin
+from saturnin.lib.tomlcache import loads, dumps, load_toml, save_toml
 
 class ApplicationInfo(Distinct): # pylint: disable=R0902
     """Information about application stored in  `.ApplicationRegistry`.
@@ -152,7 +153,7 @@ class ApplicationInfo(Distinct): # pylint: disable=R0902
         "Property setter"
         self.__conf_obj = value
 
-class ApplicationRegistry(Registry):
+class ApplicationRegistry(NameIndexMixin, Registry):
     """Saturnin application registry.
 
     Holds `.ApplicationInfo` instances.
@@ -231,7 +232,14 @@ class ApplicationRegistry(Registry):
           toml: TOML document (as created by `as_toml` method).
           ignore_errors: When True, errors are ignored, otherwise `.Error` is raised.
         """
-        data = loads(toml)
+        self._load_from_data(loads(toml), ignore_errors=ignore_errors)
+    def _load_from_data(self, data: Dict, *, ignore_errors: bool=False) -> None:
+        """Populate registry from parsed TOML document.
+
+        Arguments:
+          data: Parsed TOML document (as created by `as_toml` method).
+          ignore_errors: When True, errors are ignored, otherwise `.Error` is raised.
+        """
         self.clear()
         for uid, kwargs in data.items():
             try:
@@ -247,23 +255,20 @@ class ApplicationRegistry(Registry):
     def as_toml(self) -> str:
         """Returns registry content as TOML document.
         """
-        nodes = {str(node.uid): node.as_toml_dict() for node in self._reg.values()}
-        return dumps(nodes)
+        return dumps(self._as_toml_data())
+    def _as_toml_data(self) -> Dict:
+        """Returns registry content as dictionary suitable for storage in TOML format.
+        """
+        return {str(node.uid): node.as_toml_dict() for node in self._reg.values()}
     def load(self) -> None:
         "Read information about installed applications from previously saved TOML file."
         if directory_scheme.site_apps_toml.is_file():
-            application_registry.load_from_toml(directory_scheme.site_apps_toml.read_text())
+            self._load_from_data(load_toml(directory_scheme.site_apps_toml,
+                                           directory_scheme.cache / 'apps.json'))
     def save(self) -> None:
         "Save information about installed applications to TOML file."
-        directory_scheme.site_apps_toml.write_text(application_registry.as_toml())
-    def get_by_name(self, name: str, default: Any=None) -> Distinct:
-        """Get application by its name.
-
-        Arguments:
-            name: Application name.
-            default: Default value returned when application is not found.
-        """
-        return self.find(lambda x: x.name == name, default=default)
+        save_toml(directory_scheme.site_apps_toml, self._as_toml_data(),
+                  directory_scheme.cache / 'apps.json')
 
 #: Saturnin application registry
 application_registry: ApplicationRegistry = ApplicationRegistry()
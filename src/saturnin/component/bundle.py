@@ -108,7 +108,6 @@ class BundleThreadController(LoggingIdMixin, TracedMixin):
         Arguments:
             section: Configuration section with bundle definition.
         """
-        svc_cfg: ServiceExecConfig = ServiceExecConfig(section)
         bundle_cfg: ServiceBundleConfig = ServiceBundleConfig(section)
         bundle_cfg.load_config(self.config)
         bundle_cfg.validate()
@@ -143,6 +142,11 @@ class BundleThreadController(LoggingIdMixin, TracedMixin):
             ServiceError: On error in communication with service.
             TimeoutError: When service does not start in time.
         """
+        # Address sections by endpoint domain, anything else goes to network addresses
+        net_addresses = self.config[SECTION_NET_ADDRESS]
+        domain_sections = {ZMQDomain.LOCAL: self.config[SECTION_LOCAL_ADDRESS],
+                           ZMQDomain.NODE: self.config[SECTION_NODE_ADDRESS],
+                           ZMQDomain.NETWORK: net_addresses}
         for controller in self.services: # pylint: disable=R1702
             try:
                 controller.configure(self.config, controller.name)
@@ -153,12 +157,7 @@ class BundleThreadController(LoggingIdMixin, TracedMixin):
                     for name, addresses in controller.endpoints.items():
                         opt_name = f'{controller.name}.{name}'
                         for address in addresses:
-                            if address.domain == ZMQDomain.LOCAL:
-                                self.config[SECTION_LOCAL_ADDRESS][opt_name] = address
-                            elif address.domain == ZMQDomain.NODE:
-                                self.config[SECTION_NODE_ADDRESS][opt_name] = address
-                            else:
-                                self.config[SECTION_NET_ADDRESS][opt_name] = address
+                            domain_sections.get(address.domain, net_addresses)[opt_name] = address
             except:
                 self.stop()
                 raise
@@ -174,6 +173,10 @@ class BundleThreadController(LoggingIdMixin, TracedMixin):
         Raises:
             ServiceError: On error in communication with service.
             TimeoutError: When service does not stop in time.
+
+        Note:
+            Channels of internally created `.ChannelManager` are closed with zero LINGER,
+            as nothing is sent to stopped services.
         """
         for controller in reversed(self.services):
             try:
@@ -184,6 +187,8 @@ class BundleThreadController(LoggingIdMixin, TracedMixin):
                     warnings.warn(f"Stopping service {controller.name} failed, "
                                   f"service thread terminated", RuntimeWarning)
                     controller.terminate()
+        if not self._ext_mngr:
+            self.mngr.shutdown(forced=True)
     def join(self, timeout=None) -> None:
         """Wait until all services stop.
 
@@ -202,6 +207,8 @@ class BundleExecutor():
     """
     def __init__(self, log_context: Any):
         self.log_context = log_context
+        #: ZMQ context
+        self.ctx: zmq.Context = zmq.Context.instance()
         #: Channel manager
         self.mngr: ChannelManager = None
         #: Controller
@@ -211,7 +218,7 @@ class BundleExecutor():
     def __exit__(self, exc_type, exc_value, traceback) -> None:
         if self.mngr is not None:
             self.mngr.shutdown(forced=True)
-        zmq.Context.instance().term()
+        self.ctx.destroy(linger=0)
     def configure(self, cfg_files: List[str], *, section: str=SECTION_BUNDLE) -> None:
         """Executor configuration.
 
@@ -219,7 +226,7 @@ class BundleExecutor():
           cfg_files: List of configuration files.
           section:   Configuration section name with list of services in bundle.
         """
-        self.mngr = ChannelManager(zmq.Context.instance())
+        self.mngr = ChannelManager(self.ctx)
         self.mngr.log_context = self.log_context
         self.controller: BundleThreadController = BundleThreadController(manager=self.mngr)
         self.controller.log_context = self.log_context
@@ -240,10 +247,10 @@ class BundleExecutor():
         self.controller.start()
         try:
             self.controller.join()
-            raise KeyboardInterrupt() # This, or direct call to executor.stop()
         except KeyboardInterrupt: # SIGINT
-            self.controller.stop()
+            pass
         finally:
+            self.controller.stop()
             result = []
             for svc in self.controller.services:
                 result.append((svc.name, svc.outcome, svc.details))
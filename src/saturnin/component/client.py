@@ -41,13 +41,16 @@
 from __future__ import annotations
 import os
 import platform
-from struct import pack
+from struct import Struct
 from uuid import UUID
 from saturnin.base import (Error, ZMQAddress, Channel, TIMEOUT, INVALID, AgentDescriptor,
      PeerDescriptor)
 from saturnin.protocol.fbsp import (FBSPClient, FBSPSession, FBSPMessage,
      WelcomeMessage, ErrorMessage, MsgType)
 
+#: Precompiled packer for FBSP message tokens
+_pack_token = Struct('!Q').pack
+
 class Token():
     """FBSP message token generator.
     """
@@ -56,7 +59,7 @@ class Token():
     def next(self) -> bytes:
         """Returns next message token.
         """
-        result = pack('!Q', self._value)
+        result = _pack_token(self._value)
         self._value += 1
         return result
 
@@ -47,12 +47,13 @@ from contextlib import suppress
 from weakref import proxy
 from time import monotonic_ns
 from heapq import heappush, heappop
+from itertools import count
 import zmq
 from firebird.base.types import Conjunctive
 from firebird.base.trace import TracedMixin
 from saturnin.base import (ZMQAddress, Component, PeerDescriptor, ServiceDescriptor,
      ServiceError, Direction, State, Outcome, ChannelManager, Channel, PairChannel,
-     ComponentConfig, ConfigProto, PrioritizedItem)
+     ComponentConfig, ConfigProto)
 from saturnin.protocol.iccp import ICCPComponent
 
 #: Service control channel name
@@ -69,7 +70,9 @@ class MicroService(Component, TracedMixin, metaclass=Conjunctive): # pylint: dis
             descriptor: Service descriptor.
             peer_uid: Peer ID, `None` means that newly generated UUID type 1 should be used.
         """
+        #: Scheduled actions as (time, sequence, action) tuples
         self._heap: List = []
+        self._seq = count()
         #: Service execution outcome
         self.outcome: Outcome = Outcome.UNKNOWN
         #: Service execution outcome details
@@ -130,7 +133,7 @@ class MicroService(Component, TracedMixin, metaclass=Conjunctive): # pylint: dis
                     if callable requires arguments.
             after:  Delay in milliseconds.
         """
-        heappush(self._heap, PrioritizedItem(monotonic_ns() + (after * 1000000), action))
+        heappush(self._heap, (monotonic_ns() + (after * 1000000), next(self._seq), action))
     def get_timeout(self) -> int:
         """Returns timeout to next scheduled action.
         """
@@ -139,20 +142,20 @@ class MicroService(Component, TracedMixin, metaclass=Conjunctive): # pylint: dis
         back = []
         i = len(self._heap)
         now = monotonic_ns()
-        while self._heap and (item := heappop(self._heap)).priority < now:
+        while self._heap and (item := heappop(self._heap))[0] < now:
             back.append(item)
         if len(back) != i:
             heappush(self._heap, item)
         for value in back:
             heappush(self._heap, value)
-        return max(int((item.priority - now) / 1000000), 0)
+        return max(int((item[0] - now) / 1000000), 0)
     def run_scheduled(self) -> None:
         """Run scheduled actions.
         """
         while self._heap:
             item = heappop(self._heap)
-            if item.priority < monotonic_ns():
-                item.item()
+            if item[0] < monotonic_ns():
+                item[2]()
             else:
                 heappush(self._heap, item)
                 break
@@ -243,7 +246,9 @@ class MicroService(Component, TracedMixin, metaclass=Conjunctive): # pylint: dis
                     # Now process incomming messages
                     for chn, event in events.items():
                         if Direction.IN in event:
-                            chn.receive()
+                            chn.try_recv_batch(self.mngr.batch_size, stop=self.stop.is_set)
+                            if self.stop.is_set():
+                                break # stop quickly
                 # Now it's time for scheduled actions
                 self.run_scheduled()
             # Gracefully stop the service
@@ -59,10 +59,11 @@ from functools import partial
 from itertools import chain
 from contextlib import suppress
 from uuid import UUID
-from toml import dumps, loads
 from firebird.base.types import Distinct, load
 from firebird.base.collections import Registry
 from saturnin.base import directory_scheme, ServiceDescriptor, Error
+from saturnin.lib.registry import NameIndexMixin
+from saturnin.lib.tomlcache import loads, dumps, load_toml, save_toml
 from saturnin.lib.metadata import iter_entry_points, get_entry_point_distribution
 
 class ServiceInfo(Distinct): # pylint: disable=R0902
@@ -151,7 +152,7 @@ class ServiceInfo(Distinct): # pylint: disable=R0902
         self.__fact_obj = value
     factory_obj = property(__get_factory_obj, __set_factory_obj, None, __get_factory_obj.__doc__)
 
-class ServiceRegistry(Registry):
+class ServiceRegistry(NameIndexMixin, Registry):
     """Saturnin service registry.
 
     Holds `.ServiceInfo` instances.
@@ -232,7 +233,14 @@ class ServiceRegistry(Registry):
           toml: TOML document (as created by `as_toml` method).
           ignore_errors: When True, errors are ignored, otherwise `.Error` is raised.
         """
-        data = loads(toml)
+        self._load_from_data(loads(toml), ignore_errors=ignore_errors)
+    def _load_from_data(self, data: Dict, *, ignore_errors: bool=False) -> None:
+        """Populate registry from parsed TOML document.
+
+        Arguments:
+          data: Parsed TOML document (as created by `as_toml` method).
+          ignore_errors: When True, errors are ignored, otherwise `.Error` is raised.
+        """
         self.clear()
         for uid, kwargs in data.items():
             try:
@@ -249,23 +257,20 @@ class ServiceRegistry(Registry):
     def as_toml(self) -> str:
         """Returns registry content as TOML document.
         """
-        nodes = {str(node.uid): node.as_toml_dict() for node in self._reg.values()}
-        return dumps(nodes)
+        return dumps(self._as_toml_data())
+    def _as_toml_data(self) -> Dict:
+        """Returns registry content as dictionary suitable for storage in TOML format.
+        """
+        return {str(node.uid): node.as_toml_dict() for node in self._reg.values()}
     def load(self) -> None:
         "Read information about installed services from previously saved TOML file."
         if directory_scheme.site_services_toml.is_file():
-            service_registry.load_from_toml(directory_scheme.site_services_toml.read_text())
+            self._load_from_data(load_toml(directory_scheme.site_services_toml,
+                                           directory_scheme.cache / 'services.json'))
     def save(self) -> None:
         "Save information about installed services to TOML file."
-        directory_scheme.site_services_toml.write_text(service_registry.as_toml())
-    def get_by_name(self, name: str, default: Any=None) -> Distinct:
-        """Get service by its name.
-
-        Arguments:
-            name: Service name.
-            default: Default value returned when service is not found.
-        """
-        return self.find(lambda x: x.name == name, default=default)
+        save_toml(directory_scheme.site_services_toml, self._as_toml_data(),
+                  directory_scheme.cache / 'services.json')
 
 # Default service registration
 _iterators = [partial(iter_entry_points, 'saturnin.service')]
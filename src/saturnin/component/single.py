@@ -175,6 +175,8 @@ class SingleExecutor():
         #: Use DirectController instead ThreadController
         self.direct: bool = direct
         self.log_context = log_context
+        #: ZMQ context
+        self.ctx: zmq.Context = zmq.Context.instance()
         #: Channel manager
         self.mngr: ChannelManager = None
         #: Controller
@@ -184,7 +186,7 @@ class SingleExecutor():
     def __exit__(self, exc_type, exc_value, traceback) -> None:
         if self.mngr is not None:
             self.mngr.shutdown(forced=True)
-        zmq.Context.instance().term()
+        self.ctx.destroy(linger=0)
     def configure(self, cfg_files: List[str], *, section: str=SECTION_SERVICE) -> None:
         """Executor configuration.
 
@@ -192,7 +194,7 @@ class SingleExecutor():
           cfg_files: List of configuration files.
           section:   Configuration section name with service specification.
         """
-        self.mngr = ChannelManager(zmq.Context.instance())
+        self.mngr = ChannelManager(self.ctx)
         self.mngr.log_context = self.log_context
         self.controller: SingleController = SingleController(manager=self.mngr,
                                                              direct=self.direct)
@@ -213,9 +215,9 @@ class SingleExecutor():
         if not self.direct:
             try:
                 self.controller.join()
-                raise KeyboardInterrupt() # This, or direct call to executor.stop()
             except KeyboardInterrupt: # SIGINT
-                self.controller.stop()
+                pass
             finally:
+                self.controller.stop()
                 result = (self.controller.controller.outcome, self.controller.controller.details)
         return result
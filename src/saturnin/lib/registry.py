@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2021-present The Firebird Projects <www.firebirdsql.org>
+#
+# SPDX-License-Identifier: MIT
+#
+# PROGRAM/MODULE: saturnin
+# FILE:           saturnin/lib/registry.py
+# DESCRIPTION:    Name index for Saturnin component registries
+# CREATED:        18.10.2026
+#
+# The contents of this file are subject to the MIT License
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# Copyright (c) 2026 Firebird Project (www.firebirdsql.org)
+# All Rights Reserved.
+#
+# Contributor(s): Pavel Císař (original code)
+#                 ______________________________________
+
+"""Name index for Saturnin component registries
+
+
+"""
+
+from __future__ import annotations
+from typing import Dict, Optional, Any
+from firebird.base.types import Distinct
+
+class NameIndexMixin:
+    """Mixin for `~firebird.base.collections.Registry` of items with `name` attribute that
+    provides fast lookup by name.
+
+    The index is built on first lookup, and dropped on any change of registry content.
+
+    Important:
+        Must be listed before `~firebird.base.collections.Registry` in base classes.
+    """
+    #: Index of registered items by name (built on demand, dropped on any change)
+    _by_name: Optional[Dict[str, Distinct]] = None
+    def __setitem__(self, key, value):
+        self._by_name = None
+        super().__setitem__(key, value)
+    def __delitem__(self, key):
+        self._by_name = None
+        super().__delitem__(key)
+    def clear(self) -> None:
+        """Remove all items from registry.
+        """
+        self._by_name = None
+        super().clear()
+    def store(self, item: Distinct) -> Distinct:
+        """Register an item.
+
+        Raises:
+            ValueError: When item is already registered.
+        """
+        self._by_name = None
+        return super().store(item)
+    def remove(self, item: Distinct) -> None:
+        """Removes item from registry (same as: del R[item]).
+        """
+        self._by_name = None
+        super().remove(item)
+    def pop(self, key: Any, default: Any=None) -> Distinct:
+        """Remove specified `key` and return the corresponding item. If `key` is not found,
+        the `default` is returned.
+        """
+        self._by_name = None
+        return super().pop(key, default)
+    def popitem(self, last: bool=True) -> Distinct:
+        """Returns and removes an item. The items are returned in LIFO order if `last` is
+        true or FIFO order if false.
+        """
+        self._by_name = None
+        return super().popitem(last)
+    def get_by_name(self, name: str, default: Any=None) -> Distinct:
+        """Get registered item by its name.
+
+        Arguments:
+            name: Item name.
+            default: Default value returned when item is not found.
+        """
+        if self._by_name is None:
+            self._by_name = {}
+            for item in self._reg.values():
+                self._by_name.setdefault(item.name, item)
+        return self._by_name.get(name, default)
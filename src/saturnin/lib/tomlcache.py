@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026-present The Firebird Projects <www.firebirdsql.org>
+#
+# SPDX-License-Identifier: MIT
+#
+# PROGRAM/MODULE: saturnin
+# FILE:           saturnin/lib/tomlcache.py
+# DESCRIPTION:    Cached access to TOML files
+# CREATED:        18.10.2026
+#
+# The contents of this file are subject to the MIT License
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# Copyright (c) 2026 Firebird Project (www.firebirdsql.org)
+# All Rights Reserved.
+#
+# Contributor(s): Pavel Císař (original code)
+#                 ______________________________________
+
+"""Cached access to TOML files
+
+TOML documents are parsed with `tomllib` (or `tomli` on Python < 3.11) and written with
+`tomli_w`. Functions `loads` and `dumps` should be used instead of calling these
+libraries directly.
+
+Parsed content of TOML file is stored as JSON snapshot in cache file, together with
+modification time and size of the source TOML file. The snapshot is used instead of parsing
+the TOML file as long as the stamp matches.
+"""
+
+from __future__ import annotations
+from typing import Dict, Tuple
+from pathlib import Path
+from contextlib import suppress
+import sys
+import json
+from tomli_w import dumps as _dumps
+
+if sys.version_info >= (3, 11):
+    from tomllib import loads
+else:
+    from tomli import loads
+
+def _strip_none(data: Dict) -> Dict:
+    """Returns copy of dictionary without `None` values (they are not stored in TOML).
+    """
+    return {key: _strip_none(value) if isinstance(value, dict) else value
+            for key, value in data.items() if value is not None}
+
+def dumps(data: Dict) -> str:
+    """Returns data as TOML document. Keys with `None` values are not stored.
+
+    Arguments:
+        data: Data to be stored.
+    """
+    return _dumps(_strip_none(data))
+
+def _write_cache(cache: Path, stamp: Tuple[int, int], data: Dict) -> None:
+    """Writes JSON snapshot of parsed TOML data to cache file. Errors are ignored, and
+    data with values that cannot be stored in JSON (like dates) are not cached.
+    """
+    with suppress(OSError, TypeError, ValueError):
+        snapshot = json.dumps({'stamp': list(stamp), 'data': data})
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix('.tmp')
+        tmp.write_text(snapshot, encoding='utf-8')
+        tmp.replace(cache)
+
+def load_toml(path: Path, cache: Path) -> Dict:
+    """Returns parsed content of TOML file.
+
+    Arguments:
+        path:  TOML file.
+        cache: Cache file with JSON snapshot of parsed TOML file.
+
+    The snapshot is used when it matches modification time and size of TOML file, otherwise
+    the TOML file is parsed and new snapshot is written to cache file.
+    """
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with suppress(OSError, ValueError):
+        snapshot = json.loads(cache.read_text(encoding='utf-8'))
+        if (isinstance(snapshot, dict) and snapshot.get('stamp') == list(stamp)
+            and isinstance(data := snapshot.get('data'), dict)):
+            return data
+    data = loads(path.read_text(encoding='utf-8'))
+    _write_cache(cache, stamp, data)
+    return data
+
+def save_toml(path: Path, data: Dict, cache: Path) -> None:
+    """Writes data to TOML file, and updates the cache file with its snapshot.
+
+    Arguments:
+        path:  TOML file.
+        data:  Data to be stored.
+        cache: Cache file with JSON snapshot of parsed TOML file.
+    """
+    path.write_text(dumps(data), encoding='utf-8')
+    stat = path.stat()
+    _write_cache(cache, (stat.st_mtime_ns, stat.st_size), _strip_none(data))
@@ -186,7 +186,7 @@ class FBDPMessage(Message):
         """Returns iterable of dictionary keys to be used with `.Protocol.handlers`.
         Keys must be provided in order of precedence (from more specific to general).
         """
-        return [self.msg_type, ANY]
+        return (self.msg_type, ANY)
     def get_header(self) -> bytes:
         """Return message header (FBDP control frame).
         """
@@ -210,7 +210,7 @@ class FBSPMessage(Message):
         """Returns iterable of dictionary keys to be used with `Protocol.handlers`.
         Keys must be provided in order of precedence (from more specific to general).
         """
-        return [self.msg_type, ANY]
+        return (self.msg_type, ANY)
     def get_header(self) -> bytes:
         """Return message header (FBSP control frame).
         """
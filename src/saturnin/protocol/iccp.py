@@ -154,7 +154,7 @@ class ICCPMessage(Message): # pylint: disable=R0902
         """Returns iterable of dictionary keys to be used with `.Protocol.handlers`.
         Keys must be provided in order of precedence (from more specific to general).
         """
-        return [self.msg_type, ANY]
+        return (self.msg_type, ANY)
 
 class _ICCP(Protocol):
     """Internal Component Control Protocol (ICCP).
@@ -401,12 +401,21 @@ class ICCPComponent(_ICCP):
            config: New configuration provided by controller.
         """
 
+class ICCPControllerSession(Session):
+    """ICCP session used by controller side.
+    """
+    __slots__ = ('ready',)
+    def __init__(self):
+        super().__init__()
+        #: True when READY message was received from component
+        self.ready: bool = False
+
 class ICCPController(_ICCP):
     """Internal Component Control Protocol (ICCP) - Controller (server) side.
 
     Used by Saturnin internally for component/controller transmissions.
     """
-    def __init__(self, *, session_type: Type[Session] = Session):
+    def __init__(self, *, session_type: Type[ICCPControllerSession] = ICCPControllerSession):
         """
         Arguments:
             session_type: Class for session objects.
@@ -453,7 +462,8 @@ class ICCPController(_ICCP):
         """
         self.on_stop_controller(exc)
         super().handle_exception(channel, session, msg, exc)
-    def handle_ready(self, channel: Channel, session: Session, msg: ICCPMessage) -> ICCPMessage:
+    def handle_ready(self, channel: Channel, session: ICCPControllerSession,
+                     msg: ICCPMessage) -> ICCPMessage:
         """Process `READY` message received from component.
 
         Arguments:
@@ -467,11 +477,12 @@ class ICCPController(_ICCP):
         Raises:
             StopError: If it's NOT first READY received from component.
         """
-        if hasattr(session, 'ready'):
+        if session.ready:
             raise StopError("Unexpected READY message from component")
         session.ready = True
         return msg
-    def handle_oef(self, channel: Channel, session: Session, msg: ICCPMessage) -> ICCPMessage:
+    def handle_oef(self, channel: Channel, session: ICCPControllerSession,
+                   msg: ICCPMessage) -> ICCPMessage:
         """Process `OK/ERROR/FINISHED` messages received from component. It simply returns
         the message.
 
@@ -480,7 +491,7 @@ class ICCPController(_ICCP):
           session: Session associated with component.
           msg:     Message sent by component.
         """
-        if msg.msg_type in (MsgType.OK, MsgType.FINISHED) and not hasattr(session, 'ready'):
+        if msg.msg_type in (MsgType.OK, MsgType.FINISHED) and not session.ready:
             raise StopError(f"Unexpected {msg.msg_type.name} message from component")
         return msg
     def stop_msg(self) -> ICCPMessage:
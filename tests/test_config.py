@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2026-present The Firebird Projects <www.firebirdsql.org>
+#
+# SPDX-License-Identifier: MIT
+#
+# PROGRAM/MODULE: saturnin
+# FILE:           tests/test_config.py
+# DESCRIPTION:    Tests for Saturnin configuration
+# CREATED:        18.10.2026
+#
+# The contents of this file are subject to the MIT License
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# Copyright (c) 2026 Firebird Project (www.firebirdsql.org)
+# All Rights Reserved.
+#
+# Contributor(s): Pavel Císař (original code)
+#                 ______________________________________
+
+from __future__ import annotations
+from pathlib import Path
+import pytest
+from saturnin.base import config
+from saturnin.base.config import SaturninScheme
+
+@pytest.fixture
+def venv_home(tmp_path: Path, monkeypatch) -> Path:
+    "Virtual environment with `home` subdirectory and no SATURNIN_HOME."
+    home = tmp_path / 'home'
+    home.mkdir()
+    monkeypatch.setattr(config, '_VENV', tmp_path)
+    # SaturninScheme sets SATURNIN_HOME, so the variable must be restored after test
+    monkeypatch.setenv('SATURNIN_HOME', '')
+    monkeypatch.delenv('SATURNIN_HOME')
+    return home
+
+def test_scheme_venv_home(venv_home: Path):
+    scheme = SaturninScheme()
+    assert scheme.has_home_env()
+    assert scheme.home == venv_home
+    assert scheme.config == venv_home / 'config'
+    assert scheme.data == venv_home / 'data'
+    assert scheme.site_conf == venv_home / 'config' / 'saturnin.conf'
+
+def test_scheme_home_env_wins(venv_home: Path, tmp_path: Path, monkeypatch):
+    user_home = tmp_path / 'user'
+    monkeypatch.setenv('SATURNIN_HOME', str(user_home))
+    scheme = SaturninScheme()
+    assert scheme.home == user_home
+    assert scheme.config == user_home / 'config'
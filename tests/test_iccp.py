@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2026-present The Firebird Projects <www.firebirdsql.org>
+#
+# SPDX-License-Identifier: MIT
+#
+# PROGRAM/MODULE: saturnin
+# FILE:           tests/test_iccp.py
+# DESCRIPTION:    Tests for Internal Component Control Protocol (ICCP)
+# CREATED:        18.10.2026
+#
+# The contents of this file are subject to the MIT License
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# Copyright (c) 2026 Firebird Project (www.firebirdsql.org)
+# All Rights Reserved.
+#
+# Contributor(s): Pavel Císař (original code)
+#                 ______________________________________
+
+from __future__ import annotations
+import os
+import uuid
+import platform
+import pytest
+import zmq
+from saturnin.base import (ChannelManager, PairChannel, PeerDescriptor, Direction, ZMQAddress,
+                           INVALID)
+from saturnin.protocol.iccp import (ICCPComponent, ICCPController, ICCPControllerSession,
+                                    ICCPMessage, MsgType)
+
+@pytest.fixture
+def channels():
+    "Controller and component channels connected over inproc transport."
+    mngr = ChannelManager(zmq.Context.instance())
+    ctrl = mngr.create_channel(PairChannel, 'ctrl', ICCPController(), wait_for=Direction.IN)
+    comp = mngr.create_channel(PairChannel, 'comp', ICCPComponent())
+    mngr.warm_up()
+    address = ctrl.bind(ZMQAddress(f'inproc://{uuid.uuid4().hex}'))
+    comp.connect(address)
+    yield ctrl, comp
+    mngr.shutdown(forced=True)
+
+def send_ready(comp: PairChannel) -> None:
+    "Sends READY message from component to controller."
+    peer = PeerDescriptor(uuid.uuid1(), os.getpid(), platform.node())
+    msg = comp.protocol.ready_msg(peer, {'main': [ZMQAddress('inproc://main')]})
+    assert comp.send(msg, comp.session) == 0
+
+def test_ready_handshake(channels):
+    ctrl, comp = channels
+    send_ready(comp)
+    assert ctrl.wait(1000) == Direction.IN
+    msg = ctrl.receive()
+    assert isinstance(msg, ICCPMessage)
+    assert msg.msg_type is MsgType.READY
+    assert msg.endpoints == {'main': [ZMQAddress('inproc://main')]}
+    assert isinstance(ctrl.session, ICCPControllerSession)
+    assert ctrl.session.ready
+    # Component reports OK after READY
+    assert comp.send(comp.protocol.ok_msg(), comp.session) == 0
+    assert ctrl.wait(1000) == Direction.IN
+    assert ctrl.receive().msg_type is MsgType.OK
+
+def test_ok_before_ready(channels):
+    ctrl, comp = channels
+    stops = []
+    def on_stop_controller(exc: Exception) -> None:
+        stops.append(exc)
+    ctrl.protocol.on_stop_controller = on_stop_controller
+    assert comp.send(comp.protocol.ok_msg(), comp.session) == 0
+    assert ctrl.wait(1000) == Direction.IN
+    assert ctrl.receive() is INVALID
+    assert len(stops) == 1
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026-present The Firebird Projects <www.firebirdsql.org>
+#
+# SPDX-License-Identifier: MIT
+#
+# PROGRAM/MODULE: saturnin
+# FILE:           tests/test_transport.py
+# DESCRIPTION:    Tests for ZeroMQ messaging transport
+# CREATED:        18.10.2026
+#
+# The contents of this file are subject to the MIT License
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# Copyright (c) 2026 Firebird Project (www.firebirdsql.org)
+# All Rights Reserved.
+#
+# Contributor(s): Pavel Císař (original code)
+#                 ______________________________________
+
+from __future__ import annotations
+import uuid
+import zmq
+from saturnin.base import (ChannelManager, PushChannel, PullChannel, Protocol, ZMQAddress,
+                           Direction)
+
+def test_try_recv_batch_stop():
+    mngr = ChannelManager(zmq.Context.instance())
+    checks = []
+    def stop() -> bool:
+        checks.append(True)
+        return len(checks) == 1
+    pull = mngr.create_channel(PullChannel, 'pull', Protocol(), wait_for=Direction.IN)
+    push = mngr.create_channel(PushChannel, 'push', Protocol())
+    mngr.warm_up()
+    try:
+        address = pull.bind(ZMQAddress(f'inproc://{uuid.uuid4().hex}'))
+        push.connect(address)
+        for i in range(3):
+            push.socket.send_multipart([str(i).encode()])
+        assert pull.wait(1000) == Direction.IN
+        # Batch ends after first message when stop returns True
+        assert len(pull.try_recv_batch(10, stop=stop)) == 1
+        assert len(pull.try_recv_batch(10)) == 2
+    finally:
+        mngr.shutdown(forced=True)